@@ -8,7 +8,8 @@ text splits into larger chunks while respecting token count limits.
 
 Key Optimizations:
 1. C arrays for cumulative count calculations (48% performance improvement)
-2. Inline binary search to eliminate function call overhead
+2. A single forward scan over the cumulative counts instead of one binary search
+   per merged chunk; the scan pointer never moves backwards, so the whole merge is O(n)
 3. Maintains identical logic to the original Python implementation
 
 Performance gains: ~50% faster than the original Python implementation.
@@ -24,7 +25,7 @@ from libc.stdlib cimport malloc, free
 def _merge_splits(
     list splits,
     list token_counts, 
-    int chunk_size,
+    Py_ssize_t chunk_size,
     bint combine_whitespace=False
 ):
     """
@@ -32,19 +33,20 @@ def _merge_splits(
     
     This function takes a list of text splits and their corresponding token counts,
     then intelligently merges them into larger chunks that respect the chunk_size limit.
-    The algorithm uses a greedy approach with binary search to find optimal merge points.
+    The algorithm uses a greedy approach, scanning the cumulative counts for the
+    furthest merge point that still fits.
     
     The implementation maintains identical logic to the original Python version while
-    using C arrays for cumulative count calculations and inline binary search for
-    maximum performance.
+    using C arrays for cumulative count calculations and a monotonic forward scan in
+    place of `bisect_left` for maximum performance.
     
     Algorithm Overview:
     1. Build cumulative token counts using C arrays for fast access
-    2. For each position, use inline binary search to find the furthest merge point
+    2. For each position, advance the scan pointer to the furthest merge point
     3. Merge splits within the found range using efficient string operations
     4. Continue until all splits are processed
     
-    Time Complexity: O(n log n) where n is the number of splits
+    Time Complexity: O(n) where n is the number of splits
     Space Complexity: O(n) for cumulative counts and result storage
     
     Args:
@@ -73,16 +75,17 @@ def _merge_splits(
         [3, 3, 1]
     """
     # Declare all C variables at function start
-    cdef int splits_len = len(splits)
-    cdef int token_counts_len = len(token_counts)
-    cdef int* cumulative_counts
-    cdef int cumulative_sum = 0
-    cdef int i, token_count_val
-    cdef int current_index = 0
-    cdef int current_token_count, required_token_count, index
-    cdef int left, right, mid  # Inline binary search variables
-    cdef str merged_text
-    cdef int merged_token_count
+    cdef Py_ssize_t splits_len = len(splits)
+    cdef Py_ssize_t token_counts_len = len(token_counts)
+    cdef Py_ssize_t* cumulative_counts
+    cdef Py_ssize_t cumulative_sum = 0
+    cdef Py_ssize_t i, token_count_val
+    cdef Py_ssize_t step = 1 if combine_whitespace else 0  # +1 for whitespace token
+    cdef Py_ssize_t current_index = 0
+    cdef Py_ssize_t required_token_count, index
+    cdef Py_ssize_t scan = 0  # bisect_left position, only ever moves forward
+    cdef str joiner = " " if combine_whitespace else ""
+    cdef list merged, combined_token_counts
     
     # Early exit conditions
     if splits_len == 0 or token_counts_len == 0:
@@ -100,7 +103,7 @@ def _merge_splits(
     
     # OPTIMIZATION 1: Use C array for cumulative counts (48% improvement)
     # This eliminates Python list overhead for the performance-critical cumulative sums
-    cumulative_counts = <int*>malloc((splits_len + 1) * sizeof(int))
+    cumulative_counts = <Py_ssize_t*>malloc((splits_len + 1) * sizeof(Py_ssize_t))
     if cumulative_counts is NULL:
         raise MemoryError("Failed to allocate memory for cumulative_counts")
     
@@ -109,10 +112,7 @@ def _merge_splits(
         cumulative_counts[0] = 0
         for i in range(splits_len):
             token_count_val = token_counts[i]
-            if combine_whitespace:
-                cumulative_sum += token_count_val + 1  # +1 for whitespace token
-            else:
-                cumulative_sum += token_count_val
+            cumulative_sum += token_count_val + step
             cumulative_counts[i + 1] = cumulative_sum
         
         # Main merging loop - maintains original algorithm logic
@@ -120,41 +120,28 @@ def _merge_splits(
         combined_token_counts = []
         
         while current_index < splits_len:
-            current_token_count = cumulative_counts[current_index]
-            required_token_count = current_token_count + chunk_size
-            
-            # OPTIMIZATION 2: Inline binary search (eliminates function call overhead)
-            # Original used: index = min(bisect_left(cumulative_counts, required_token_count, lo=current_index) - 1, len(splits))
-            left = current_index
-            right = splits_len + 1
+            required_token_count = cumulative_counts[current_index] + chunk_size
             
-            # Binary search to find insertion point for required_token_count
-            while left < right:
-                mid = (left + right) // 2
-                if cumulative_counts[mid] < required_token_count:
-                    left = mid + 1
-                else:
-                    right = mid
+            # OPTIMIZATION 2: Forward scan equivalent to
+            # bisect_left(cumulative_counts, required_token_count, lo=current_index).
+            # The target only grows with current_index, so `scan` is never reset.
+            if scan < current_index:
+                scan = current_index
+            while scan <= splits_len and cumulative_counts[scan] < required_token_count:
+                scan += 1
             
             # Apply the same logic as original: bisect_left(...) - 1, then min with len(splits)
-            index = min(left - 1, splits_len)
+            index = min(scan - 1, splits_len)
             
             # If current_index == index, we need to move to the next index (same as original)
             if index == current_index:
                 index += 1
             
-            # Merge splits using the same logic as original
-            if combine_whitespace:
-                merged_text = " ".join(splits[current_index:index])
-            else:
-                merged_text = "".join(splits[current_index:index])
-            
-            # Adjust token count (same as original)
-            merged_token_count = cumulative_counts[min(index, splits_len)] - cumulative_counts[current_index]
-            
-            # Add merged result to output lists
-            merged.append(merged_text)
-            combined_token_counts.append(merged_token_count)
+            # Merge splits and record the token count of the merged range
+            merged.append(joiner.join(splits[current_index:index]))
+            combined_token_counts.append(
+                cumulative_counts[index] - cumulative_counts[current_index]
+            )
             
             # Move to next unprocessed split
             current_index = index
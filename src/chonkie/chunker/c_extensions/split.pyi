@@ -24,4 +24,20 @@ def split_text(
         Sequence of text splits
 
     """
-    ...
\ No newline at end of file
+    ...
+
+def merge_short_segments(
+    splits: List[str],
+    min_characters_per_segment: int = 12
+) -> List[str]:
+    """Merge segments shorter than the minimum into their neighbours.
+    
+    Args:
+        splits: List of non-empty text segments
+        min_characters_per_segment: Minimum characters per segment for merging
+        
+    Returns:
+        List of merged text segments
+
+    """
+    ...
@@ -96,46 +96,54 @@ def split_text(
     return _merge_short_segments_fast(splits, min_characters_per_segment)
 
 
+def merge_short_segments(list splits, int min_characters_per_segment=12):
+    """
+    Merge segments shorter than min_characters_per_segment into their neighbours.
+    
+    Python-visible wrapper around the merge step of split_text, for callers that
+    do their own delimiter scanning.
+    
+    Args:
+        splits: List of non-empty text segments
+        min_characters_per_segment: Minimum characters per segment for merging
+    
+    Returns:
+        List of merged text segments
+    """
+    return _merge_short_segments_fast(splits, min_characters_per_segment)
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef list _merge_short_segments_fast(list splits, int min_characters):
     """
     Fast segment merging using the RecursiveChunker approach.
-    Mirrors the exact logic from RecursiveChunker._split_text.
+    Mirrors the exact logic from RecursiveChunker._merge_short_splits.
+    
+    Short segments are collected in a buffer and joined once when the buffer
+    reaches min_characters, instead of growing a str with += per segment.
     """
     cdef:
-        str current = ""
+        list buffer = PyList_New(0)
         list merged = PyList_New(0)
         str split
-        int split_len, current_len
+        Py_ssize_t buffer_len = 0
     
     if not splits:
         return splits
     
     for split in splits:
-        split_len = len(split)
-        current_len = len(current)
-        
-        if split_len < min_characters:
-            # Add to current accumulator
-            current += split
-        elif current:
-            # We have accumulated content, add the split and append
-            current += split
-            PyList_Append(merged, current)
-            current = ""
-        else:
-            # Split is long enough and no accumulated content
-            PyList_Append(merged, split)
+        PyList_Append(buffer, split)
+        buffer_len += len(split)
         
-        # Check if current accumulator is now long enough
-        current_len = len(current)
-        if current_len >= min_characters:
-            PyList_Append(merged, current)
-            current = ""
+        # Flush once the accumulated content is long enough
+        if buffer_len >= min_characters:
+            PyList_Append(merged, "".join(buffer))
+            buffer = PyList_New(0)
+            buffer_len = 0
     
     # Add any remaining accumulated content
-    if current:
-        PyList_Append(merged, current)
+    if buffer_len > 0:
+        PyList_Append(merged, "".join(buffer))
     
     return merged
\ No newline at end of file
@@ -3,10 +3,12 @@
 Splits text into smaller chunks recursively. Express chunking logic through RecursiveLevel objects.
 """
 
+import math
 from bisect import bisect_left
 from functools import lru_cache
-from itertools import accumulate
-from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+from itertools import accumulate, repeat
+from operator import add
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from chonkie.chunker.base import BaseChunker
 from chonkie.types import (
@@ -15,9 +17,10 @@ from chonkie.types import (
     RecursiveRules,
 )
 
-# Import the unified split function
+# Import the optimized short-split merge; delimiter scanning itself is done
+# with the level's precompiled pattern so both paths split identically
 try:
-    from .c_extensions.split import split_text
+    from .c_extensions.split import merge_short_segments
     SPLIT_AVAILABLE = True
 except ImportError:
     SPLIT_AVAILABLE = False
@@ -75,8 +78,12 @@ class RecursiveChunker(BaseChunker):
         self.chunk_size = chunk_size
         self.min_characters_per_chunk = min_characters_per_chunk
         self.rules = rules
-        self.sep = "✄"
         self._CHARS_PER_TOKEN = 6.5
+        # Bounded FIFO cache of one document's splits, keyed by (level, text);
+        # texts longer than _SPLIT_CACHE_MAX_CHARS are rarely repeated and not kept
+        self._SPLIT_CACHE_SIZE = 1024
+        self._SPLIT_CACHE_MAX_CHARS = 1024
+        self._split_cache: Dict[Tuple[int, str], List[str]] = {}
 
     @classmethod
     def from_recipe(cls,
@@ -116,71 +123,172 @@ class RecursiveChunker(BaseChunker):
         )
 
     @lru_cache(maxsize=4096)
-    def _estimate_token_count(self, text: str) -> int:
-        # Always return the actual token count for accuracy
-        # The estimate was only used as an optimization hint
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens in a split; splits such as words repeat within a document."""
         return self.tokenizer.count_tokens(text)
 
-    def _split_text(self, text: str, recursive_level: RecursiveLevel) -> list[str]:
-        """Split the text into chunks using the delimiters."""
-        if SPLIT_AVAILABLE and recursive_level.delimiters:
-            # Use optimized Cython split function for delimiter-based splitting only
-            return list(split_text(
-                text=text,
-                delim=recursive_level.delimiters,
-                include_delim=recursive_level.include_delim,
-                min_characters_per_segment=self.min_characters_per_chunk,
-                whitespace_mode=False,
-                character_fallback=False
-            ))
+    def _estimate_token_counts(self, splits: List[str]) -> Tuple[List[int], bool]:
+        """Estimate the token count of each split.
+
+        Splits whose character length alone puts them over chunk_size are not
+        tokenized; they only need to be known to be too big, so they get
+        chunk_size + 1. Everything else is counted exactly, one split at a time
+        through the memo: batch encoders such as tiktoken's start a thread pool
+        per call, which costs more than the per-level batches here save.
+
+        Also returns whether every split is over chunk_size, decided from the
+        counted splits alone, so callers can skip merging without another pass.
+        """
+        # len(split) // _CHARS_PER_TOKEN > chunk_size, as one integer comparison
+        oversized_chars = math.ceil(self._CHARS_PER_TOKEN * (self.chunk_size + 1))
+        token_counts = []
+        all_oversized = True
+        for split in splits:
+            if len(split) >= oversized_chars:
+                token_counts.append(self.chunk_size + 1)
+            else:
+                count = self._count_tokens(split)
+                token_counts.append(count)
+                if count <= self.chunk_size:
+                    all_oversized = False
+        return token_counts, all_oversized
+
+    def _split_text(
+        self, text: str, recursive_level: RecursiveLevel, level: int
+    ) -> list[str]:
+        """Split the text into chunks using the delimiters, reusing cached splits.
+
+        Documents built from repeating templates re-split the same text at the
+        same level; those splits are served from a FIFO cache of at most
+        _SPLIT_CACHE_SIZE entries. The cache only lives for one document (see
+        _recursive_chunk), so chunker settings can't change under it.
+        """
+        if len(text) > self._SPLIT_CACHE_MAX_CHARS:
+            return self._split_text_uncached(text, recursive_level)
+        key = (level, text)
+        splits = self._split_cache.get(key)
+        if splits is None:
+            splits = self._split_text_uncached(text, recursive_level)
+            if len(self._split_cache) >= self._SPLIT_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                self._split_cache.pop(next(iter(self._split_cache)), None)
+            self._split_cache[key] = splits
+        return splits
+
+    def _split_text_uncached(
+        self, text: str, recursive_level: RecursiveLevel
+    ) -> list[str]:
+        """Split the text into chunks using the level's split strategy."""
+        split_mode = recursive_level._split_mode
+        if split_mode == "whitespace":
+            return self._split_whitespace(text, recursive_level)
+        if split_mode == "delimiters":
+            return self._split_delimiters(text, recursive_level)
+        return self._split_tokens(text, recursive_level)
+
+    def _split_whitespace(self, text: str, recursive_level: RecursiveLevel) -> List[str]:
+        """Split the text on single spaces.
+
+        Runs of spaces leave empty splits and other whitespace stays inside the
+        words, so re-joining with single spaces reproduces the text exactly.
+        """
+        return text.split(" ")
+
+    def _split_delimiters(self, text: str, recursive_level: RecursiveLevel) -> List[str]:
+        """Split the text at the level's delimiters and merge short splits."""
+        if recursive_level._translate_table is not None and text.isascii():
+            # Every delimiter maps onto the same character, so one split on it
+            # drops them all. Non-ASCII text misses translate's fast path.
+            table = recursive_level._translate_table
+            pieces = text.translate(table).split(next(iter(table.values())))
+        elif recursive_level._automaton is not None:
+            pieces = self._split_with_automaton(
+                text, recursive_level._automaton, recursive_level.include_delim
+            )
         else:
-            # Fallback to original implementation
-            if recursive_level.whitespace:
-                splits = text.split(" ")
-            elif recursive_level.delimiters:
-                if recursive_level.include_delim == "prev":
-                    for delimiter in recursive_level.delimiters:
-                        text = text.replace(delimiter, delimiter + self.sep)
-                elif recursive_level.include_delim == "next":
-                    for delimiter in recursive_level.delimiters:
-                        text = text.replace(delimiter, self.sep + delimiter)
-                else:
-                    for delimiter in recursive_level.delimiters:
-                        text = text.replace(delimiter, self.sep)
-
-                splits = [split for split in text.split(self.sep) if split != ""]
-
-                # Merge short splits
-                current = ""
-                merged = []
-                for split in splits:
-                    if len(split) < self.min_characters_per_chunk:
-                        current += split
-                    elif current:
-                        current += split
-                        merged.append(current)
-                        current = ""
-                    else:
-                        merged.append(split)
-
-                    if len(current) >= self.min_characters_per_chunk:
-                        merged.append(current)
-                        current = ""
-
-                if current:
-                    merged.append(current)
-
-                splits = merged
+            # Single pass over the text; the capture group makes `split`
+            # return [text, delim, text, delim, ..., text]
+            parts = recursive_level._delim_regex.split(text)  # type: ignore[union-attr]
+            if recursive_level.include_delim == "prev":
+                pieces = [parts[i] + parts[i + 1] for i in range(0, len(parts) - 1, 2)]
+                pieces.append(parts[-1])
+            elif recursive_level.include_delim == "next":
+                pieces = [parts[0]]
+                pieces.extend(parts[i] + parts[i + 1] for i in range(1, len(parts), 2))
             else:
-                # Encode, Split, and Decode
-                encoded = self.tokenizer.encode(text)
-                token_splits = [
-                    encoded[i : i + self.chunk_size]
-                    for i in range(0, len(encoded), self.chunk_size)
-                ]
-                splits = list(self.tokenizer.decode_batch(token_splits))
-
-            return splits
+                pieces = parts[::2]
+
+        splits = [split for split in pieces if split != ""]
+
+        # Merge short splits, using the Cython implementation when available
+        if SPLIT_AVAILABLE:
+            return merge_short_segments(splits, self.min_characters_per_chunk)
+        return self._merge_short_splits(splits)
+
+    def _split_tokens(self, text: str, recursive_level: RecursiveLevel) -> List[str]:
+        """Encode, split into chunk_size token windows, and decode."""
+        encoded = self.tokenizer.encode(text)
+        token_splits = [
+            encoded[i : i + self.chunk_size]
+            for i in range(0, len(encoded), self.chunk_size)
+        ]
+        return list(self.tokenizer.decode_batch(token_splits))
+
+    def _merge_short_splits(self, splits: List[str]) -> List[str]:
+        """Merge splits shorter than min_characters_per_chunk into their neighbours."""
+        # Collect parts and join once per merged split, rather than growing a str
+        buffer: List[str] = []
+        buffer_len = 0
+        merged = []
+        for split in splits:
+            buffer.append(split)
+            buffer_len += len(split)
+            if buffer_len >= self.min_characters_per_chunk:
+                merged.append("".join(buffer))
+                buffer.clear()
+                buffer_len = 0
+
+        if buffer_len > 0:
+            merged.append("".join(buffer))
+
+        return merged
+
+    def _split_with_automaton(
+        self, text: str, automaton: Any, include_delim: Optional[str]
+    ) -> List[str]:
+        """Cut the text at the delimiter matches found by the level's automaton.
+
+        Overlapping matches are resolved leftmost-longest, the same way the level's
+        regex resolves them, so both split paths agree.
+        """
+        # `iter` yields every (end_index, delim) match, including overlapping ones.
+        # `iter_long` would do the selection for us, but drops a match at the very
+        # end of the text when a longer delimiter was partially matched before it.
+        matches = sorted(
+            (end_index + 1 - len(delimiter), end_index + 1)
+            for end_index, delimiter in automaton.iter(text)
+        )
+        pieces = []
+        cursor = 0
+        last_end = 0
+        for i, (start, end) in enumerate(matches):
+            if start < last_end:
+                continue
+            # Among matches starting here, the longest sorts last
+            if i + 1 < len(matches) and matches[i + 1][0] == start:
+                continue
+            last_end = end
+            if include_delim == "prev":
+                pieces.append(text[cursor:end])
+                cursor = end
+            elif include_delim == "next":
+                pieces.append(text[cursor:start])
+                cursor = start
+            else:
+                pieces.append(text[cursor:start])
+                cursor = end
+        pieces.append(text[cursor:])
+        return pieces
 
     def _make_chunks(
         self,
@@ -259,91 +367,94 @@ class RecursiveChunker(BaseChunker):
         if combine_whitespace:
             # +1 for the whitespace
             cumulative_token_counts = list(
-                accumulate([0] + token_counts, lambda x, y: x + y + 1)
+                accumulate(map(add, token_counts, repeat(1)), initial=0)
             )
         else:
-            cumulative_token_counts = list(accumulate([0] + token_counts))
+            cumulative_token_counts = list(accumulate(token_counts, initial=0))
         current_index = 0
         combined_token_counts = []
+        n = len(splits)
+        joiner = " " if combine_whitespace else ""
 
-        while current_index < len(splits):
+        while current_index < n:
             current_token_count = cumulative_token_counts[current_index]
             required_token_count = current_token_count + self.chunk_size
 
-            # Find the index to merge at
-            index = min(
-                bisect_left(
-                    cumulative_token_counts,
-                    required_token_count,
-                    lo=current_index,
-                )
-                - 1,
-                len(splits),
+            # Find the index to merge at; always take at least one split.
+            # bisect_left from current_index is > current_index since chunk_size > 0.
+            index = max(
+                current_index + 1,
+                min(
+                    bisect_left(cumulative_token_counts, required_token_count, lo=current_index) - 1,
+                    n,
+                ),
             )
 
-            # If current_index == index,
-            # we need to move to the next index
-            if index == current_index:
-                index += 1
-
             # Merge splits
-            if combine_whitespace:
-                merged.append(" ".join(splits[current_index:index]))
-            else:
-                merged.append("".join(splits[current_index:index]))
+            merged.append(joiner.join(splits[current_index:index]))
 
             # Adjust token count
-            combined_token_counts.append(
-                cumulative_token_counts[min(index, len(splits))] - current_token_count
-            )
+            combined_token_counts.append(cumulative_token_counts[index] - current_token_count)
             current_index = index
 
         return merged, combined_token_counts
 
     def _recursive_chunk(
-        self, text: str, level: int = 0, start_offset: int =0
+        self,
+        text: str,
+        level: int = 0,
+        start_offset: int = 0,
+        levels: Optional[List[RecursiveLevel]] = None,
     ) -> Sequence[RecursiveChunk]:
-        """Recursive helper for core chunking."""
+        """Recursive helper for core chunking.
+
+        `levels` is the rules' level list, snapshotted once per document and
+        passed down so each call indexes a plain list instead of the rules.
+        """
         if not text:
             return []
 
-        if level >= len(self.rules):
-            return [
-                self._make_chunks(text, self._estimate_token_count(text), level, start_offset)
-            ]
+        if levels is None:
+            levels = self.rules.levels or []
 
-        curr_rule = self.rules[level]
-        if curr_rule is None:
+        if level >= len(levels):
             return [
-                self._make_chunks(text, self._estimate_token_count(text), level, start_offset)
+                self._make_chunks(text, self.tokenizer.count_tokens(text), level, start_offset)
             ]
 
-        splits = self._split_text(text, curr_rule)
-        token_counts = [self._estimate_token_count(split) for split in splits]
+        curr_rule = levels[level]
 
-        if curr_rule.delimiters is None and not curr_rule.whitespace:
-            merged, combined_token_counts = splits, token_counts
+        if level == 0:
+            # A new document: drop the previous one's splits; its own top-level
+            # text is only ever split once, so it isn't cached either
+            self._split_cache.clear()
+            splits = self._split_text_uncached(text, curr_rule)
+        else:
+            splits = self._split_text(text, curr_rule, level)
+        token_counts, all_oversized = self._estimate_token_counts(splits)
 
-        elif curr_rule.delimiters is None and curr_rule.whitespace:
+        if (curr_rule.delimiters is None and not curr_rule.whitespace) or all_oversized:
+            # Token-level splits and splits that are all too big pass through unmerged
+            merged, combined_token_counts = splits, token_counts
+        else:
             merged, combined_token_counts = self._merge_splits(
-                splits, token_counts, combine_whitespace=True
+                splits, token_counts, combine_whitespace=curr_rule.whitespace
             )
+
+        if curr_rule.whitespace:
             # NOTE: This is a hack to fix the reconstruction issue when whitespace is used.
             # When whitespace is there, " ".join only adds space between words, not before the first word.
             # To make it combine back properly, all splits except the first one are prefixed with a space.
-            merged = merged[:1] + [" " + text for (i, text) in enumerate(merged) if i != 0]
-
-        else:
-            merged, combined_token_counts = self._merge_splits(
-                splits, token_counts, combine_whitespace=False
-            )
+            merged = merged[:1] + [" " + split for split in merged[1:]]
 
         # Chunk long merged splits
         chunks: List[RecursiveChunk] = []
         current_offset = start_offset
         for split, token_count in zip(merged, combined_token_counts):
             if token_count > self.chunk_size:
-                recursive_result = self._recursive_chunk(split, level + 1, current_offset)
+                recursive_result = self._recursive_chunk(
+                    split, level + 1, current_offset, levels
+                )
                 chunks.extend(recursive_result)
             else:
                 chunks.append(self._make_chunks(split, token_count, level, current_offset))
@@ -358,7 +469,9 @@ class RecursiveChunker(BaseChunker):
             text (str): Text to chunk.
 
         """
-        return self._recursive_chunk(text=text, level=0, start_offset=0)
+        return self._recursive_chunk(
+            text=text, level=0, start_offset=0, levels=self.rules.levels or []
+        )
 
     def __repr__(self) -> str:
         """Get a string representation of the recursive chunker."""
@@ -1,12 +1,24 @@
 """Custom types for recursive chunking."""
 
 import re
-from dataclasses import dataclass
-from typing import Dict, Iterator, List, Literal, Optional, Union
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterator, List, Literal, Optional, Pattern, Union
 
-from chonkie.types.base import Chunk
+from chonkie.types.base import Chunk, Context
 from chonkie.utils import Hubbie
 
+# Optional Aho-Corasick automaton for levels with many multi-character delimiters
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Below this many multi-character delimiters the compiled regex alternation is
+# at least as fast as the automaton, whatever the match density
+_AUTOMATON_MIN_DELIMITERS = 24
+
 
 @dataclass
 class RecursiveLevel:
@@ -26,6 +38,18 @@ class RecursiveLevel:
     include_delim: Optional[Literal["prev", "next"]] = "prev"
     pattern: Optional[str] = None
     pattern_mode: Literal["split", "extract"] = "split"
+    _delim_regex: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _automaton: Optional[Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _translate_table: Optional[Dict[int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _split_mode: Literal["whitespace", "delimiters", "tokens"] = field(
+        default="tokens", init=False, repr=False, compare=False
+    )
 
     def _validate_fields(self) -> None:
         """Validate all fields have legal values."""
@@ -69,6 +93,72 @@ class RecursiveLevel:
     def __post_init__(self) -> None:
         """Validate attributes."""
         self._validate_fields()
+        self._delim_regex = self._compile_delimiters()
+        self._automaton = self._build_automaton()
+        self._translate_table = self._build_translate_table()
+        self._split_mode = self._resolve_split_mode()
+
+    def _resolve_split_mode(self) -> Literal["whitespace", "delimiters", "tokens"]:
+        """Name the split strategy for this level, so chunkers don't re-derive it per call."""
+        if self.whitespace:
+            return "whitespace"
+        if self._delim_regex is not None:
+            return "delimiters"
+        return "tokens"
+
+    def _delimiter_list(self) -> List[str]:
+        """Return the delimiters as a list, whether given as a str or a list."""
+        if not self.delimiters:
+            return []
+        if isinstance(self.delimiters, str):
+            return [self.delimiters]
+        return list(self.delimiters)
+
+    def _compile_delimiters(self) -> Optional[Pattern[str]]:
+        """Compile the delimiters into a single alternation with a capture group.
+
+        Longer delimiters are tried first, so overlapping ones (e.g. "..." and ".")
+        match the longest option.
+        """
+        delimiters = self._delimiter_list()
+        if not delimiters:
+            return None
+        ordered = sorted(delimiters, key=len, reverse=True)
+        return re.compile("(" + "|".join(re.escape(delim) for delim in ordered) + ")")
+
+    def _build_automaton(self) -> Optional[Any]:
+        """Build an Aho-Corasick automaton over the delimiters, if worthwhile.
+
+        The regex alternation is tried delimiter by delimiter at each position, so
+        its cost grows with the number of delimiters while the automaton's does
+        not; `re` also turns single characters into a character set. The automaton
+        is only built for levels with at least _AUTOMATON_MIN_DELIMITERS
+        multi-character delimiters. Requires `pyahocorasick`.
+        """
+        delimiters = self._delimiter_list()
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        if sum(len(delim) > 1 for delim in delimiters) < _AUTOMATON_MIN_DELIMITERS:
+            return None
+        automaton = ahocorasick.Automaton()
+        for delim in delimiters:
+            automaton.add_word(delim, delim)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_translate_table(self) -> Optional[Dict[int, str]]:
+        """Build a table mapping every delimiter onto the first one, if applicable.
+
+        Only used when delimiters are dropped (include_delim is None) and all of
+        them are single ASCII characters; `str.translate` followed by `str.split`
+        then replaces the regex split with two C-level passes.
+        """
+        delimiters = self._delimiter_list()
+        if self.include_delim is not None or not delimiters:
+            return None
+        if any(len(delim) != 1 or not delim.isascii() for delim in delimiters):
+            return None
+        return str.maketrans(dict.fromkeys(delimiters, delimiters[0]))
 
     def __repr__(self) -> str:
         """Return a string representation of the RecursiveLevel."""
@@ -80,7 +170,7 @@ class RecursiveLevel:
 
     def to_dict(self) -> dict:
         """Return the RecursiveLevel as a dictionary."""
-        return self.__dict__.copy()
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
 
     @classmethod
     def from_dict(cls, data: dict) -> "RecursiveLevel":
@@ -241,9 +331,14 @@ class RecursiveChunk(Chunk):
 
     def to_dict(self) -> Dict:
         """Return the RecursiveChunk as a dictionary."""
-        return self.__dict__.copy()
+        return super().to_dict()
 
     @classmethod
     def from_dict(cls, data: Dict) -> "RecursiveChunk":
         """Create a RecursiveChunk object from a dictionary."""
-        return cls(**data)
+        data = dict(data)
+        context_repr = data.pop("context", None)
+        return cls(
+            **data,
+            context=Context.from_dict(context_repr) if context_repr else None,
+        )
@@ -11,6 +11,8 @@ a recursive chunking strategy based on configurable rules. The tests verify:
 - Edge cases and error conditions
 """
 
+import pickle
+
 import pytest
 
 from chonkie import (
@@ -132,6 +134,69 @@ def test_recursive_chunker_token_count_default_rules(
     assert all(len(chunk.text) >= 12 for chunk in chunks)
 
 
+def test_recursive_chunker_skips_counting_oversized_splits(
+    monkeypatch: pytest.MonkeyPatch, sample_text: str, default_rules: RecursiveRules
+) -> None:
+    """Test that splits too long to fit a chunk are never sent to the tokenizer."""
+    chunker = RecursiveChunker(
+        rules=default_rules, chunk_size=64, min_characters_per_chunk=12
+    )
+    counted = []
+    count_tokens = chunker.tokenizer.count_tokens
+
+    def spy(text: str) -> int:
+        counted.append(text)
+        return count_tokens(text)
+
+    monkeypatch.setattr(chunker.tokenizer, "count_tokens", spy)
+    chunks = chunker.chunk(sample_text)
+    assert len(chunks) > 0
+    assert counted
+    assert all(len(text) // chunker._CHARS_PER_TOKEN <= 64 for text in counted)
+    assert all(chunk.token_count <= 64 for chunk in chunks)
+
+
+def test_recursive_chunker_tiktoken_counts_without_batching(
+    monkeypatch: pytest.MonkeyPatch, sample_text: str
+) -> None:
+    """Test that tiktoken splits are counted one by one, not via encode_batch's thread pool."""
+    tiktoken = pytest.importorskip("tiktoken")
+    # Byte-level encoding, so the test needs no download
+    encoding = tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("encode_batch should not be called")
+
+    monkeypatch.setattr(encoding, "encode_batch", fail)
+    chunker = RecursiveChunker(tokenizer_or_token_counter=encoding, chunk_size=64)
+    chunks = chunker.chunk(sample_text)
+    assert "".join(chunk.text for chunk in chunks) == sample_text
+    assert all(len(encoding.encode(chunk.text)) <= 64 for chunk in chunks)
+
+
+def test_recursive_chunker_skips_merge_when_all_oversized(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a level whose splits are all too big is not sent through the merge."""
+    rules = RecursiveRules(levels=[RecursiveLevel(delimiters=["\n\n"]), RecursiveLevel()])
+    chunker = RecursiveChunker(rules=rules, chunk_size=8)
+    text = "\n\n".join(["twelve chars", "a much longer paragraph of text"])
+    assert chunker._estimate_token_counts(text.split("\n\n")) == ([12, 31], True)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("_merge_splits should not be called")
+
+    monkeypatch.setattr(chunker, "_merge_splits", fail)
+    chunks = chunker.chunk(text)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert all(chunk.token_count <= 8 for chunk in chunks)
+
+
 def test_recursive_chunker_reconstruction_default_rules(
     sample_text: str, default_rules: RecursiveRules
 ) -> None:
@@ -416,6 +481,171 @@ def test_recursive_chunker_min_characters_per_chunk(sample_text: str) -> None:
     assert len(chunks) == 1
     assert chunks[0].text == "Hello!"
 
+
+@pytest.mark.parametrize("include_delim", ["prev", "next"])
+def test_recursive_chunker_include_delim(include_delim: str) -> None:
+    """Test that delimiters are attached to the correct side of each split."""
+    text = "First part... Second part; third part... Fourth part; fifth."
+    rules = RecursiveRules(
+        levels=[RecursiveLevel(delimiters=["...", ";"], include_delim=include_delim)]
+    )
+    chunker = RecursiveChunker(rules=rules, chunk_size=12, min_characters_per_chunk=1)
+    chunks = chunker.chunk(text)
+    assert text == "".join(chunk.text for chunk in chunks)
+    assert all(
+        chunk.text == text[chunk.start_index : chunk.end_index] for chunk in chunks
+    )
+    if include_delim == "prev":
+        assert chunks[0].text == "First part..."
+    else:
+        assert chunks[1].text.startswith("...")
+
+
+@pytest.mark.parametrize("include_delim", ["prev", "next", None])
+@pytest.mark.parametrize("min_characters_per_chunk", [1, 3])
+def test_recursive_chunker_split_paths_agree(
+    monkeypatch: pytest.MonkeyPatch,
+    include_delim: str,
+    min_characters_per_chunk: int,
+) -> None:
+    """Test that splits do not depend on whether the Cython extension is built."""
+    pytest.importorskip("chonkie.chunker.c_extensions.split")
+    text = "a..b;c...d; e.f"
+    level = RecursiveLevel(delimiters=["...", ";", "."], include_delim=include_delim)
+    chunker = RecursiveChunker(
+        rules=RecursiveRules(levels=[level]),
+        min_characters_per_chunk=min_characters_per_chunk,
+    )
+    cython_splits = chunker._split_text_uncached(text, level)
+    monkeypatch.setattr("chonkie.chunker.recursive.SPLIT_AVAILABLE", False)
+    python_splits = chunker._split_text_uncached(text, level)
+    assert python_splits == cython_splits
+    if include_delim == "prev" and min_characters_per_chunk == 1:
+        # Overlapping delimiters resolve to the longest match
+        assert python_splits == ["a.", ".", "b;", "c...", "d;", " e.", "f"]
+
+
+@pytest.mark.parametrize("include_delim", ["prev", "next", None])
+def test_recursive_chunker_automaton_matches_regex(
+    monkeypatch: pytest.MonkeyPatch, sample_text: str, include_delim: str
+) -> None:
+    """Test that the Aho-Corasick split path agrees with the regex split path."""
+    pytest.importorskip("ahocorasick")
+    monkeypatch.setattr("chonkie.chunker.recursive.SPLIT_AVAILABLE", False)
+    # Enough multi-character delimiters for the level to build its automaton
+    tags = [f"<{i}>" for i in range(20)]
+    level = RecursiveLevel(
+        delimiters=[". ", "! ", "? ", "\n\n", "ing", "n"] + tags, include_delim=include_delim
+    )
+    assert level._automaton is not None
+    chunker = RecursiveChunker(
+        rules=RecursiveRules(levels=[level]), chunk_size=128, min_characters_per_chunk=1
+    )
+    # Ends on a delimiter that is also the tail of a partial longer match
+    text = sample_text + " <3> <12><7> thin"
+    automaton_splits = chunker._split_text_uncached(text, level)
+    level._automaton = None
+    regex_splits = chunker._split_text_uncached(text, level)
+    assert automaton_splits == regex_splits
+    assert len(automaton_splits) > 1
+
+
+@pytest.mark.parametrize("text", ["a,b;;c.d e, f;", "caf\u00e9, na\u00efve; r\u00e9sum\u00e9."])
+def test_recursive_chunker_translate_matches_regex(text: str) -> None:
+    """Test that the str.translate split path agrees with the regex split path."""
+    level = RecursiveLevel(delimiters=[",", ";", "."], include_delim=None)
+    assert level._translate_table is not None
+    chunker = RecursiveChunker(
+        rules=RecursiveRules(levels=[level]), min_characters_per_chunk=1
+    )
+    translate_splits = chunker._split_text_uncached(text, level)
+    level._translate_table = None
+    assert translate_splits == chunker._split_text_uncached(text, level)
+
+
+def test_recursive_chunker_split_cache() -> None:
+    """Test that splits are reused across calls and the cache stays bounded."""
+    level = RecursiveLevel(delimiters=[". "])
+    chunker = RecursiveChunker(
+        rules=RecursiveRules(levels=[level]), min_characters_per_chunk=1
+    )
+    chunker._SPLIT_CACHE_SIZE = 2
+    first = chunker._split_text("One. Two. Three.", level, 1)
+    assert chunker._split_text("One. Two. Three.", level, 1) is first
+    chunker._split_text("Four. Five.", level, 1)
+    chunker._split_text("Six. Seven.", level, 1)
+    assert len(chunker._split_cache) == 2
+    assert (1, "One. Two. Three.") not in chunker._split_cache
+    chunker._SPLIT_CACHE_MAX_CHARS = 8
+    chunker._split_text("Eight. Nine.", level, 1)
+    assert (1, "Eight. Nine.") not in chunker._split_cache
+
+
+def test_recursive_chunker_split_cache_is_per_document() -> None:
+    """Test that cached splits don't outlive a document or a settings change."""
+    rules = RecursiveRules(
+        levels=[
+            RecursiveLevel(delimiters=["\n"]),
+            RecursiveLevel(delimiters=[". "]),
+            RecursiveLevel(),
+        ]
+    )
+    text = "a. b. c. d. e. f. g. h.\nx"
+    chunker = RecursiveChunker(rules=rules, chunk_size=4, min_characters_per_chunk=10)
+    first = [chunk.text for chunk in chunker.chunk(text)]
+    assert chunker._split_cache
+    assert all(level > 0 for level, _ in chunker._split_cache)
+    chunker.min_characters_per_chunk = 1
+    fresh = RecursiveChunker(rules=rules, chunk_size=4, min_characters_per_chunk=1)
+    expected = [chunk.text for chunk in fresh.chunk(text)]
+    assert expected != first
+    assert [chunk.text for chunk in chunker.chunk(text)] == expected
+
+
+def test_recursive_chunker_split_mode_follows_level() -> None:
+    """Test that the split strategy comes from the level, even after a level is replaced."""
+    rules = RecursiveRules(levels=[RecursiveLevel(whitespace=True)])
+    chunker = RecursiveChunker(rules=rules, chunk_size=4, min_characters_per_chunk=1)
+    chunker.chunk("aa bb cc")
+    # Replacing twice frees the first replacement, whose id a later level may reuse
+    for _ in range(2):
+        rules.levels[0] = RecursiveLevel(delimiters=[","])
+    text = "aa bb, cc dd, ee ff"
+    chunks = chunker.chunk(text)
+    assert [chunk.text for chunk in chunks] == ["aa bb,", " cc dd,", " ee ff"]
+    restored = pickle.loads(pickle.dumps(chunker))
+    assert [chunk.text for chunk in restored.chunk(text)] == [chunk.text for chunk in chunks]
+
+
+def test_recursive_chunker_whitespace_level_preserves_spacing() -> None:
+    """Test that the whitespace level keeps space runs, tabs and newlines in place."""
+    rules = RecursiveRules(levels=[RecursiveLevel(whitespace=True)])
+    chunker = RecursiveChunker(rules=rules, chunk_size=6)
+    text = "one  two\tthree\nfour   five six"
+    chunks = chunker.chunk(text)
+    assert len(chunks) > 1
+    assert "".join(chunk.text for chunk in chunks) == text
+    for chunk in chunks:
+        assert text[chunk.start_index : chunk.end_index] == chunk.text
+
+
+@pytest.mark.parametrize("combine_whitespace", [False, True])
+def test_recursive_chunker_merge_paths_agree(combine_whitespace: bool) -> None:
+    """Test that the Cython merge matches the Python fallback merge."""
+    merge = pytest.importorskip("chonkie.chunker.c_extensions.merge")
+    token_counts = [3, 0, 7, 1, 12, 2, 2, 9, 4, 0, 6, 5, 1, 15, 3]
+    splits = [str(i) for i in range(len(token_counts))]
+    for chunk_size in range(1, 20):
+        chunker = RecursiveChunker(chunk_size=chunk_size)
+        expected = chunker._merge_splits_fallback(
+            splits, token_counts, combine_whitespace
+        )
+        merged, counts = merge._merge_splits(
+            splits, token_counts, chunk_size, combine_whitespace
+        )
+        assert (list(merged), list(counts)) == (list(expected[0]), list(expected[1]))
+
+
 def test_recursive_chunker_from_recipe_default() -> None:
     """Test that RecursiveChunker.from_recipe works with default parameters."""
     chunker = RecursiveChunker.from_recipe()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from chonkie import RecursiveChunk, RecursiveLevel, RecursiveRules
+from chonkie import Context, RecursiveChunk, RecursiveLevel, RecursiveRules
 
 
 def test_recursive_level_init() -> None:
@@ -38,6 +38,33 @@ def test_recursive_level_serialization() -> None:
     assert reconstructed.include_delim == "prev"
 
 
+def test_recursive_level_automaton_threshold() -> None:
+    """Test that the automaton is only built for many multi-character delimiters."""
+    pytest.importorskip("ahocorasick")
+    many = [f"<{i}>" for i in range(24)]
+    assert RecursiveLevel(delimiters=many)._automaton is not None
+    assert RecursiveLevel(delimiters=many[:-1])._automaton is None
+    assert RecursiveLevel(delimiters=many[:-1] + [","])._automaton is None
+    assert RecursiveLevel(delimiters=[". ", "! ", "? "])._automaton is None
+    assert RecursiveLevel(whitespace=True)._automaton is None
+
+
+def test_recursive_level_translate_table() -> None:
+    """Test that the translate table is only built for dropped single-char delimiters."""
+    assert RecursiveLevel(delimiters=[",", ";"], include_delim=None)._translate_table
+    assert RecursiveLevel(delimiters=[",", ";"])._translate_table is None
+    assert RecursiveLevel(delimiters=[",", "..."], include_delim=None)._translate_table is None
+    assert RecursiveLevel(delimiters=[",", "\u2014"], include_delim=None)._translate_table is None
+
+
+def test_recursive_level_split_mode() -> None:
+    """Test that each level records the split strategy it needs."""
+    assert RecursiveLevel(whitespace=True)._split_mode == "whitespace"
+    assert RecursiveLevel(delimiters=[".", "!"])._split_mode == "delimiters"
+    assert RecursiveLevel(delimiters="\n")._split_mode == "delimiters"
+    assert RecursiveLevel()._split_mode == "tokens"
+
+
 # RecursiveRules Tests
 def test_recursive_rules_default_init() -> None:
     """Test RecursiveRules default initialization."""
@@ -98,6 +125,23 @@ def test_recursive_chunk_serialization() -> None:
     assert reconstructed.level == 1
     assert reconstructed.text == chunk.text
 
+
+def test_recursive_chunk_serialization_with_context() -> None:
+    """Test that a RecursiveChunk's context survives a dict round trip."""
+    chunk = RecursiveChunk(
+        text="test chunk",
+        start_index=0,
+        end_index=10,
+        token_count=2,
+        level=1,
+        context=Context(text="surrounding text", token_count=2),
+    )
+    chunk_dict = chunk.to_dict()
+    assert chunk_dict["context"] == chunk.context.to_dict()
+    reconstructed = RecursiveChunk.from_dict(chunk_dict)
+    assert reconstructed == chunk
+
+
 def test_recursive_level_from_recipe() -> None:
     """Test RecursiveLevel from recipe."""
     level = RecursiveLevel.from_recipe("default", lang="en")